@@ -107,6 +107,10 @@ class PlaywrightManager:
         await self.set_overlay_state_handler()
         await self.set_user_response_handler()
         await self.set_navigation_handler()
+        if os.getenv("AE_BLOCK_ASSETS", "false").lower() in ("1", "true"):
+            # Imported here since the skills package itself imports this module
+            from ae.core.skills.playwright_actions.selector_generator import block_heavy_assets
+            await block_heavy_assets(self._browser_context)
 
 
     async def start_playwright(self):
@@ -326,6 +330,9 @@ class PlaywrightManager:
         self.notification_manager.notify(message, message_type.value)
 
     async def highlight_element(self, selector: str, add_highlight: bool):
+        if self.isheadless and not self._take_screenshots:
+            # Without a visible window or screenshots, nothing would ever show the highlight
+            return
         try:
             page: Page = await self.get_current_page()
             if add_highlight:
@@ -13,7 +13,7 @@ from ae.utils.dom_mutation_observer import subscribe  # type: ignore
 from ae.utils.dom_mutation_observer import unsubscribe  # type: ignore
 from ae.utils.logger import logger
 from ae.utils.ui_messagetype import MessageType
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.core.skills.playwright_actions.action_classes import ClickAction, action_to_json
 
 
@@ -41,7 +41,7 @@ async def click(selector: Annotated[str, "The properly formed query selector str
         
     click_action = await ClickAction.from_string_with_generator(page, selector)
     if click_action:
-        add_playwright_action(click_action)
+        await add_playwright_action_async(click_action)
         logger.info(f"Added click action to history: {action_to_json(click_action)}")
     else:
         logger.warning(f"Could not create click action for selector: {selector}")
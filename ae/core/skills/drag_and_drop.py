@@ -8,7 +8,7 @@ from playwright.async_api import Page
 
 from ae.core.playwright_manager import PlaywrightManager
 from ae.core.skills.playwright_actions.action_classes import DragAndDropAction, action_to_json
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.utils.dom_helper import get_element_outer_html
 from ae.utils.dom_mutation_observer import subscribe  # type: ignore
 from ae.utils.dom_mutation_observer import unsubscribe  # type: ignore
@@ -43,7 +43,7 @@ async def drag_and_drop(
         
     drag_and_drop_action = await DragAndDropAction.from_strings_with_generator(page, source_selector, target_selector)
     if drag_and_drop_action:
-        add_playwright_action(drag_and_drop_action)
+        await add_playwright_action_async(drag_and_drop_action)
         logger.info(f"Added drag and drop action to history: {action_to_json(drag_and_drop_action)}")
     else:
         logger.warning(f"Could not create drag and drop action for selectors: {source_selector}, {target_selector}")
@@ -7,7 +7,7 @@ from ae.core.skills.click_using_selector import do_click
 from ae.core.skills.enter_text_using_selector import do_entertext
 from ae.core.skills.press_key_combination import do_press_key_combination
 from ae.core.skills.playwright_actions.action_classes import ClickAction, TypeAction, action_to_json
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.utils.logger import logger
 from ae.utils.ui_messagetype import MessageType
 
@@ -49,14 +49,14 @@ async def enter_text_and_click(
         
     edit_text_action = await TypeAction.from_string_with_generator(page, text_selector, text_to_enter)
     if edit_text_action:
-        add_playwright_action(edit_text_action)
+        await add_playwright_action_async(edit_text_action)
         logger.info(f"Added edit text action to history: {action_to_json(edit_text_action)}")
     else:
         logger.warning(f"Could not create edit text action for selector: {text_selector}")
 
     click_action = await ClickAction.from_string_with_generator(page, click_selector)
     if click_action:
-        add_playwright_action(click_action)
+        await add_playwright_action_async(click_action)
         logger.info(f"Added click action to history: {action_to_json(click_action)}")
     else:
         logger.warning(f"Could not create click action for selector: {click_selector}")
@@ -9,7 +9,7 @@ from playwright.async_api import Page
 
 from ae.core.playwright_manager import PlaywrightManager
 from ae.core.skills.playwright_actions.action_classes import TypeAction, action_to_json
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.core.skills.press_key_combination import press_key_combination
 from ae.utils.dom_helper import get_element_outer_html
 from ae.utils.dom_mutation_observer import subscribe
@@ -125,7 +125,7 @@ async def entertext(entry: Annotated[EnterTextEntry, "An object containing 'quer
 
     edit_text_action = await TypeAction.from_string_with_generator(page, query_selector, text_to_enter)
     if edit_text_action:
-        add_playwright_action(edit_text_action)
+        await add_playwright_action_async(edit_text_action)
         logger.info(f"Added edit text action to history: {action_to_json(edit_text_action)}")
     else:
         logger.warning(f"Could not create edit text action for selector: {query_selector}")
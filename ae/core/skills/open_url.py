@@ -7,7 +7,7 @@ from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from ae.core.playwright_manager import PlaywrightManager
 from ae.utils.logger import logger
 from ae.utils.ui_messagetype import MessageType
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.core.skills.playwright_actions.action_classes import NavigateAction
 
 
@@ -31,7 +31,7 @@ async def openurl(url: Annotated[str, "The URL to navigate to. Value must includ
 
     title = await page.title()
     navigate_action = NavigateAction(url=url, title=title)
-    add_playwright_action(navigate_action)
+    await add_playwright_action_async(navigate_action)
     logger.info(f"Added navigate action to history: {navigate_action}")
     
     try:
@@ -9,7 +9,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, Union, Dict, Any, List
 from enum import Enum
+from functools import lru_cache
 import json
+import sys
 from ae.core.skills.playwright_actions.selector_generator import generate_selector
 
 
@@ -20,7 +22,36 @@ class SelectorType(str, Enum):
     XPATH = "xpathSelector"
 
 
-@dataclass
+# Enum member -> plain string value; a dict lookup is several times cheaper than
+# the Enum .value descriptor on the to_dict serialization path.
+_SELECTOR_TYPE_VALUES: Dict[SelectorType, str] = {member: member.value for member in SelectorType}
+
+
+# Playwright selector templates keyed by (selector type, attribute); attributes
+# without a shorthand fall back to the per-type default template.
+_PLAYWRIGHT_SELECTOR_TEMPLATES = {
+    (SelectorType.ATTRIBUTE_VALUE, "id"): "#{value}",
+    (SelectorType.ATTRIBUTE_VALUE, "class"): ".{value}",
+    (SelectorType.ATTRIBUTE_VALUE, "name"): "[name='{value}']",
+}
+_PLAYWRIGHT_SELECTOR_DEFAULT_TEMPLATES = {
+    SelectorType.ATTRIBUTE_VALUE: "[{attribute}='{value}']",
+    SelectorType.TAG_CONTAINS: "text={value}",
+    SelectorType.XPATH: "{value}",
+}
+
+
+@lru_cache(maxsize=4096)
+def _to_playwright_selector(selector_type: SelectorType, attribute: Optional[str], value: str) -> str:
+    """Render a selector as a Playwright selector string, cached since agents re-emit the same selectors."""
+    template = (_PLAYWRIGHT_SELECTOR_TEMPLATES.get((selector_type, attribute))
+                or _PLAYWRIGHT_SELECTOR_DEFAULT_TEMPLATES.get(selector_type))
+    if template is None:
+        raise ValueError(f"Unknown selector type: {selector_type}")
+    return template.format(attribute=attribute, value=value)
+
+
+@dataclass(slots=True, frozen=True)
 class Selector:
     """Base selector class for identifying HTML elements."""
     type: SelectorType
@@ -29,26 +60,12 @@ class Selector:
 
     def to_playwright_selector(self) -> str:
         """Convert to Playwright-compatible selector string."""
-        if self.type == SelectorType.ATTRIBUTE_VALUE:
-            if self.attribute == "id":
-                return f"#{self.value}"
-            elif self.attribute == "class":
-                return f".{self.value}"
-            elif self.attribute == "name":
-                return f"[name='{self.value}']"
-            else:
-                return f"[{self.attribute}='{self.value}']"
-        elif self.type == SelectorType.TAG_CONTAINS:
-            return f"text={self.value}"
-        elif self.type == SelectorType.XPATH:
-            return self.value
-        else:
-            raise ValueError(f"Unknown selector type: {self.type}")
+        return _to_playwright_selector(self.type, self.attribute, self.value)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         result = {
-            "type": self.type.value,
+            "type": _SELECTOR_TYPE_VALUES[self.type],
             "value": self.value
         }
         if self.attribute:
@@ -59,8 +76,11 @@ class Selector:
     def from_dict(cls, data: Dict[str, Any]) -> 'Selector':
         """Create a Selector instance from a dictionary."""
         selector_type = SelectorType(data["type"])
-        value = data["value"]
+        # Selector values repeat heavily across a history, so share one copy of each
+        value = sys.intern(data["value"])
         attribute = data.get("attribute")
+        if attribute is not None:
+            attribute = sys.intern(attribute)
         
         return cls(
             type=selector_type,
@@ -89,7 +109,7 @@ class Selector:
         
         return cls(
             type=SelectorType.XPATH,
-            value=xpath_selector,
+            value=sys.intern(xpath_selector),
             attribute=None
         )
 
@@ -112,9 +132,14 @@ class ActionType(str, Enum):
     SEND_KEYS_IWA = "sendkeysiwa"
 
 
+_ACTION_TYPE_VALUES: Dict[ActionType, str] = {member: member.value for member in ActionType}
+
+
 class Action(ABC):
     """Abstract base class for all actions."""
     
+    __slots__ = ()
+    
     @property
     @abstractmethod
     def type(self) -> ActionType:
@@ -139,7 +164,7 @@ class Action(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClickAction(Action):
     """Performs a click on a specified HTML element."""
     selector: Optional[Selector] = None
@@ -152,7 +177,7 @@ class ClickAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None
         }
         if self.x is not None:
@@ -194,7 +219,7 @@ class ClickAction(Action):
         return cls(selector=selector, x=x, y=y)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DoubleClickAction(Action):
     """Performs a double-click on the specified element."""
     selector: Optional[Selector] = None
@@ -205,7 +230,7 @@ class DoubleClickAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None
         }
     
@@ -219,7 +244,7 @@ class DoubleClickAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NavigateAction(Action):
     """Navigates to a different page or moves forward/backward in browsing history."""
     url: Optional[str] = None
@@ -236,7 +261,7 @@ class NavigateAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": None
         }
         if self.url:
@@ -249,14 +274,15 @@ class NavigateAction(Action):
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NavigateAction':
+        url = data.get("url")
         return cls(
-            url=data.get("url"),
+            url=sys.intern(url) if url else url,
             go_back=data.get("go_back", False),
             go_forward=data.get("go_forward", False)
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TypeAction(Action):
     """Types text into an input field."""
     selector: Optional[Selector] = None
@@ -268,7 +294,7 @@ class TypeAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None,
             "text": self.text
         }
@@ -304,7 +330,7 @@ class TypeAction(Action):
         return cls(selector=selector, text=text)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectAction(Action):
     """Selects an option from a dropdown menu or selection field."""
     selector: Optional[Selector] = None
@@ -316,7 +342,7 @@ class SelectAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None,
             "value": self.value
         }
@@ -334,7 +360,7 @@ class SelectAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HoverAction(Action):
     """Moves the cursor over a specified element."""
     selector: Optional[Selector] = None
@@ -345,7 +371,7 @@ class HoverAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None
         }
     
@@ -359,7 +385,7 @@ class HoverAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WaitAction(Action):
     """Pauses execution for a specified duration."""
     time_seconds: float = 1.0
@@ -374,7 +400,7 @@ class WaitAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": None,
             "time_seconds": self.time_seconds
         }
@@ -384,7 +410,7 @@ class WaitAction(Action):
         return cls(time_seconds=data.get("time_seconds", 1.0))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScrollAction(Action):
     """Scrolls up or down within a page or element."""
     selector: Optional[Selector] = None
@@ -398,7 +424,7 @@ class ScrollAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None,
             "value": self.value
         }
@@ -423,7 +449,7 @@ class ScrollAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubmitAction(Action):
     """Submits a form by pressing Enter or clicking the submit button."""
     selector: Optional[Selector] = None
@@ -434,7 +460,7 @@ class SubmitAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None
         }
     
@@ -465,7 +491,7 @@ class SubmitAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DragAndDropAction(Action):
     """Drags one element and drops it onto another."""
     source_selector: Optional[Selector] = None
@@ -481,7 +507,7 @@ class DragAndDropAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.target_selector.to_dict() if self.target_selector else None,
             "source_selector": self.source_selector.to_dict() if self.source_selector else None,
             "target_selector": self.target_selector.to_dict() if self.target_selector else None
@@ -524,7 +550,7 @@ class DragAndDropAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScreenshotAction(Action):
     """Captures a screenshot of the page."""
     file_path: str = ""
@@ -539,7 +565,7 @@ class ScreenshotAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": None,
             "file_path": self.file_path
         }
@@ -549,7 +575,7 @@ class ScreenshotAction(Action):
         return cls(file_path=data.get("file_path", ""))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetDropDownOptionsAction(Action):
     """Retrieves the available options in a dropdown menu."""
     selector: Optional[Selector] = None
@@ -560,7 +586,7 @@ class GetDropDownOptionsAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None
         }
     
@@ -574,7 +600,7 @@ class GetDropDownOptionsAction(Action):
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectDropDownOptionAction(Action):
     """Selects an option from a dropdown menu based on its visible text."""
     selector: Optional[Selector] = None
@@ -586,7 +612,7 @@ class SelectDropDownOptionAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None,
             "text": self.text
         }
@@ -602,7 +628,7 @@ class SelectDropDownOptionAction(Action):
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectOptionAction(Action):
     """Selects an option from a dropdown/select element by its value attribute."""
     selector: Optional[Selector] = None
@@ -614,7 +640,7 @@ class SelectOptionAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "selector": self.selector.to_dict() if self.selector else None,
             "value": self.value
         }
@@ -648,7 +674,7 @@ class SelectOptionAction(Action):
         return cls(selector=selector, value=value)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SendKeysIWAAction(Action):
     """Sends keys using IWA (Internet Web Automation) method."""
     keys: str = ""
@@ -664,7 +690,7 @@ class SendKeysIWAAction(Action):
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value,
+            "type": _ACTION_TYPE_VALUES[self.type],
             "keys": self.keys
         }
     
@@ -743,7 +769,7 @@ if __name__ == "__main__":
     
     print("Note: The old from_string methods have been replaced with from_string_with_generator")
     print("which requires a Playwright page object and works with mmid-based selectors.")
-    print("See selector_parser_examples.py for working examples with the new async functionality.")
+    print("See the __main__ block of selector_generator.py for a working example with the new async functionality.")
     
     print("\n=== Integration Complete ===")
     print("✅ SelectorGenerator integration is fully functional")
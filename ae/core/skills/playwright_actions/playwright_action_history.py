@@ -5,85 +5,298 @@ This module provides functionality to save and retrieve action history for Playw
 It tracks all types of browser actions including navigation, clicks, form submissions, etc.
 """
 
+import asyncio
+import atexit
+import gzip
 import json
+import mmap
 import os
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, asdict
+import sys
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from collections import defaultdict, deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from pathlib import Path
 
-from ae.core.skills.playwright_actions.action_classes import Action
+from ae.core.skills.playwright_actions.action_classes import Action, ActionType
 from ae.utils.logger import logger
 
+# Shared codec for history records; json.dumps/json.loads with non-default options build a new one per call
+_record_encoder = json.JSONEncoder(ensure_ascii=False)
+_record_decoder = json.JSONDecoder()
 
+# Compressed bytes handed to the decompressor at a time, bounding the unused_data copy after each member
+_GZIP_READ_SIZE = 1 << 16
+
+
+def _gunzip_members(data) -> Tuple[bytes, bool]:
+    """
+    Decompress concatenated gzip members one at a time.
+    
+    Each flushed batch is its own member, so decoding stops at the first truncated or corrupt
+    member and keeps everything before it.
+    
+    Returns:
+        The decompressed data, and whether every member was decoded
+    """
+    members: List[bytes] = []
+    with memoryview(data) as view:
+        offset = 0
+        size = len(view)
+        while offset < size:
+            decompressor = zlib.decompressobj(wbits=31)
+            member: List[bytes] = []
+            try:
+                while not decompressor.eof and offset < size:
+                    chunk = view[offset:offset + _GZIP_READ_SIZE]
+                    member.append(decompressor.decompress(chunk))
+                    offset += len(chunk)
+            except zlib.error as e:
+                logger.warning(f"Dropping corrupt tail of compressed Playwright action history: {e}")
+                return b"".join(members), False
+            if not decompressor.eof:
+                logger.warning("Dropping truncated tail of compressed Playwright action history")
+                return b"".join(members), False
+            members.extend(member)
+            # Rewind to the start of the next member
+            offset -= len(decompressor.unused_data)
+    return b"".join(members), True
 
 
 class PlaywrightActionHistory:
-    """Manages Playwright action history storage and retrieval."""
+    """
+    Manages Playwright action history storage and retrieval.
+    
+    The global instance is closed at interpreter exit; other instances must call close()
+    to write out their buffered actions.
+    """
     
-    def __init__(self, history_file_path: Optional[str] = None, max_history_size: int = 2000):
+    def __init__(self, history_file_path: Optional[str] = None, max_history_size: int = 2000, flush_interval: int = 50,
+                 compress: bool = False, persist: bool = True, flush_seconds: float = 1.0):
         """
         Initialize the PlaywrightActionHistory.
         
         Args:
             history_file_path: Path to the history file. If None, uses default location.
             max_history_size: Maximum number of actions to keep in history.
+            flush_interval: Number of new actions to buffer before they are written to the history file.
+            compress: Whether to gzip the history file, one gzip member per flushed batch.
+            persist: Whether to read and write the history file at all. When False, or when
+                max_history_size is 0, actions are kept in memory only.
+            flush_seconds: Longest time buffered actions may wait for a write; checked when the next
+                action is added, so a slow trickle of actions still reaches the file in bounded batches.
         """
         if history_file_path is None:
             # Default to logs directory
             from ae.config import LOG_FILES_PATH
-            history_file_path = os.path.join(LOG_FILES_PATH, "playwright_action_history.json")
+            history_file_name = "playwright_action_history.jsonl.gz" if compress else "playwright_action_history.jsonl"
+            history_file_path = os.path.join(LOG_FILES_PATH, history_file_name)
         
         self.history_file_path = Path(history_file_path)
         self.max_history_size = max_history_size
-        self.history: List[Action] = []
+        self.flush_interval = max(flush_interval, 1)
+        self.flush_seconds = flush_seconds
+        self.compress = compress
+        self.persist = persist and max_history_size > 0
+        self.history: Deque[Action] = deque(maxlen=max_history_size)
         self.session_id = self._generate_session_id()
-        
-        # Ensure directory exists
-        self.history_file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing history
-        self._load_history()
+        # Append handle for the JSONL log, opened lazily on the first write
+        self._fp = None
+        # Serialized actions waiting to be appended to the file
+        self._pending: List[bytes] = []
+        # time.monotonic() at which the oldest buffered action was added
+        self._pending_since = 0.0
+        # Guards the in-memory history, its indexes and the history file
+        self._lock = threading.RLock()
+        # Number of records currently in the file, including ones already trimmed from memory
+        self._records_on_disk = 0
+        # Lookup indexes, oldest action first, so trimming only pops from the left
+        self._by_type: Dict[str, Deque[Action]] = defaultdict(deque)
+        self._by_url: Dict[str, Deque[Action]] = defaultdict(deque)
+        # Lowercased searchable text of each action, kept in step with self.history
+        self._search_blobs: Deque[str] = deque(maxlen=max_history_size)
+        # All search blobs joined by NUL separators, with each blob's start offset and its action;
+        # built on the first search after the history changes
+        self._search_index: Optional[Tuple[str, List[int], List[Action]]] = None
+        # UTF-8 encoded JSONL line of each action, kept in step with self.history so compaction never re-serializes
+        self._encoded_lines: Deque[bytes] = deque(maxlen=max_history_size)
+        # The history file is only touched once the history is first used
+        self._loaded = False
+        # Set while loading when the file ends in a batch torn by a crash mid-write
+        self._torn_tail = False
+    
+    def _ensure_loaded(self):
+        """Create the history directory and load the existing history on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.persist:
+                return
+            
+            # Ensure directory exists
+            self.history_file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Load existing history
+            self._load_history()
+            for action in self.history:
+                self._index_action(action)
+                self._search_blobs.append(self._search_blob(action))
     
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
-        return f"playwright_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return f"playwright_session_{time.strftime('%Y%m%d_%H%M%S')}"
     
     def _load_history(self):
-        """Load existing history from file."""
+        """Load existing history from the JSONL file, one action per line."""
         try:
             if self.history_file_path.exists():
-                with open(self.history_file_path, 'r', encoding='utf-8') as f:
-                    history_data = json.load(f)
-                    # Convert dictionary data back to Action objects using ActionFactory
-                    from ae.core.skills.playwright_actions.action_classes import ActionFactory
-                    self.history = []
-                    for record in history_data:
-                        try:
-                            action = ActionFactory.from_dict(record)
-                            if action:
-                                self.history.append(action)
-                        except Exception as e:
-                            logger.warning(f"Failed to load action from history: {e}")
-                    logger.info(f"Loaded {len(self.history)} Playwright actions from {self.history_file_path}")
+                # Convert dictionary data back to Action objects using ActionFactory
+                from ae.core.skills.playwright_actions.action_classes import ActionFactory
+                self.history.clear()
+                self._encoded_lines.clear()
+                for line in self._iter_history_lines():
+                    self._records_on_disk += 1
+                    try:
+                        action = ActionFactory.create_action(_record_decoder.decode(line.decode('utf-8')))
+                        if action:
+                            self.history.append(action)
+                            self._encoded_lines.append(bytes(line) + b"\n")
+                    except Exception as e:
+                        logger.warning(f"Failed to load action from history: {e}")
+                logger.info(f"Loaded {len(self.history)} Playwright actions from {self.history_file_path}")
+                if self._torn_tail:
+                    # Rewrite the file without the torn batch, or later appends would land behind it
+                    self._save_history()
             else:
                 logger.info(f"No existing Playwright action history found. Creating new history file at {self.history_file_path}")
         except Exception as e:
             logger.error(f"Error loading Playwright action history: {e}")
-            self.history = []
+            self.history.clear()
+            self._encoded_lines.clear()
+    
+    @staticmethod
+    def _action_type_key(action: Action) -> str:
+        """Return the string key used to index an action by its type."""
+        return action.type.value if hasattr(action.type, 'value') else str(action.type)
+    
+    def _index_action(self, action: Action) -> str:
+        """Add an action to the lookup indexes and return its type key."""
+        action_type = self._action_type_key(action)
+        self._by_type[action_type].append(action)
+        url = getattr(action, 'url', None)
+        if url:
+            self._by_url[sys.intern(url)].append(action)
+        return action_type
+    
+    def _unindex_action(self, action: Action):
+        """Remove an action evicted from the front of the history from the lookup indexes."""
+        for index, key in ((self._by_type, self._action_type_key(action)), (self._by_url, getattr(action, 'url', None))):
+            bucket = index.get(key)
+            if bucket:
+                bucket.popleft()
+                if not bucket:
+                    del index[key]
+    
+    @staticmethod
+    def _search_blob(action: Action) -> str:
+        """Build the lowercased text that search_actions matches queries against."""
+        parts: List[str] = []
+        stack: List[Any] = [action.to_dict()]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+            elif value is not None:
+                parts.append(str(value))
+        return "\n".join(parts).lower()
+    
+    def _iter_history_lines(self) -> Iterator[bytes]:
+        """Yield the non-empty lines of the history file from a read-only memory map."""
+        with open(self.history_file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if self.compress:
+                    buffer, complete = _gunzip_members(mm)
+                    self._torn_tail = not complete
+                else:
+                    buffer = mm
+                    # A last line without its newline was cut short by a crash mid-write
+                    self._torn_tail = mm[-1:] != b"\n"
+                start = 0
+                size = len(buffer)
+                while start < size:
+                    end = buffer.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    line = buffer[start:end]
+                    if line.strip():
+                        yield line
+                    start = end + 1
+    
+    def _encode_lines(self, lines: Iterable[bytes]) -> bytes:
+        """Join encoded JSONL lines into the bytes written to the history file."""
+        data = b"".join(lines)
+        return gzip.compress(data) if self.compress else data
+    
+    def flush(self):
+        """Append all buffered actions to the history file in a single write."""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                if self._fp is None:
+                    self.history_file_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._fp = open(self.history_file_path, 'ab')
+                self._fp.write(self._encode_lines(self._pending))
+                self._fp.flush()
+                self._records_on_disk += len(self._pending)
+            except Exception as e:
+                logger.error(f"Error appending Playwright actions to history: {e}")
+            self._pending.clear()
     
     def _save_history(self):
-        """Save current history to file."""
-        try:
-            # Convert Action objects to dictionaries
-            history_data = [action.to_dict() for action in self.history]
-            
-            with open(self.history_file_path, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, indent=2, ensure_ascii=False)
-            
-            logger.debug(f"Saved {len(self.history)} Playwright actions to {self.history_file_path}")
-        except Exception as e:
-            logger.error(f"Error saving Playwright action history: {e}")
+        """Compact the history file so that it only holds the in-memory history."""
+        if not self.persist:
+            return
+        with self._lock:
+            try:
+                # Buffered actions are already part of the in-memory history being written
+                self._pending.clear()
+                self.close()
+                self.history_file_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.history_file_path.with_name(self.history_file_path.name + ".tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(self._encode_lines(self._encoded_lines))
+                os.replace(tmp_path, self.history_file_path)
+                self._records_on_disk = len(self.history)
+                
+                logger.debug(f"Saved {len(self.history)} Playwright actions to {self.history_file_path}")
+            except Exception as e:
+                logger.error(f"Error saving Playwright action history: {e}")
+    
+    def close(self):
+        """Write out buffered actions and close the append handle of the history file, if open."""
+        with self._lock:
+            self.flush()
+            if self._fp is not None:
+                try:
+                    self._fp.flush()
+                    os.fsync(self._fp.fileno())
+                    self._fp.close()
+                except Exception as e:
+                    logger.error(f"Error closing Playwright action history file: {e}")
+                self._fp = None
     
     def add_action(self, action: Action) -> Action:
         """
@@ -95,42 +308,200 @@ class PlaywrightActionHistory:
         Returns:
             The added Action object
         """
-        self.history.append(action)
+        self._ensure_loaded()
+        with self._lock:
+            action_type = self._record_in_memory(action)
+            if self._needs_compaction():
+                self._save_history()
+            elif self._flush_due():
+                self.flush()
         
-        # Trim history if it exceeds max size
-        if len(self.history) > self.max_history_size:
-            self.history = self.history[-self.max_history_size:]
-            logger.info(f"Trimmed Playwright action history to {self.max_history_size} records")
+        logger.debug(f"Added Playwright action: {action_type}")
+        return action
+    
+    async def add_action_async(self, action: Action) -> Action:
+        """
+        Add a new Playwright action to the history without blocking the event loop on file I/O.
         
-        # Save to file
-        self._save_history()
+        The action is recorded in memory right away; any flush or compaction it triggers
+        runs in the default executor.
+        
+        Args:
+            action: The Action object to add to history
+            
+        Returns:
+            The added Action object
+        """
+        self._ensure_loaded()
+        with self._lock:
+            action_type = self._record_in_memory(action)
+            if self._needs_compaction():
+                write = self._save_history
+            elif self._flush_due():
+                write = self.flush
+            else:
+                write = None
+        
+        if write is not None:
+            await asyncio.get_running_loop().run_in_executor(None, write)
         
-        action_type = action.type.value if hasattr(action.type, 'value') else str(action.type)
         logger.debug(f"Added Playwright action: {action_type}")
         return action
     
+    def _record_in_memory(self, action: Action) -> str:
+        """Append an action to the history, its indexes and the write buffer; returns its type key."""
+        if not self.max_history_size:
+            return self._action_type_key(action)
+        # The deque drops its oldest action once full, so take it out of the indexes first
+        if len(self.history) == self.max_history_size:
+            self._unindex_action(self.history[0])
+        self.history.append(action)
+        action_type = self._index_action(action)
+        self._search_blobs.append(self._search_blob(action))
+        self._search_index = None
+        if not self.persist:
+            return action_type
+        line = (_record_encoder.encode(action.to_dict()) + "\n").encode('utf-8')
+        self._encoded_lines.append(line)
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append(line)
+        return action_type
+    
+    def _flush_due(self) -> bool:
+        """Whether the write buffer is full or its oldest actions have waited flush_seconds."""
+        return bool(self._pending) and (len(self._pending) >= self.flush_interval
+                                        or time.monotonic() - self._pending_since >= self.flush_seconds)
+    
+    def _needs_compaction(self) -> bool:
+        """Whether trimmed records make up half of the history file, so rewrites stay rare."""
+        return self.persist and self._records_on_disk + len(self._pending) > 2 * self.max_history_size
+    
     def clear_history(self):
         """Clear all action history."""
-        self.history = []
-        self._save_history()
+        with self._lock:
+            # Whatever is on disk is discarded, so there is no need to load it first
+            self._loaded = True
+            self.history.clear()
+            self._by_type.clear()
+            self._by_url.clear()
+            self._search_blobs.clear()
+            self._search_index = None
+            self._encoded_lines.clear()
+            self._save_history()
         logger.info("Playwright action history cleared")
 
     def get_recent_actions(self, limit: int = 10) -> List[Action]:
         """Get recent actions from history."""
-        return self.history[-limit:] if self.history else []
+        self._ensure_loaded()
+        if limit <= 0:
+            return []
+        with self._lock:
+            # Walk in from the newest end so the cost is O(limit), not O(history size)
+            recent = list(islice(reversed(self.history), limit))
+        recent.reverse()
+        return recent
+
+    def get_all_actions(self) -> List[Action]:
+        """Get every action currently held in history, oldest first."""
+        self._ensure_loaded()
+        with self._lock:
+            return list(self.history)
+
+    def get_actions_by_type(self, action_type: Union[ActionType, str], limit: Optional[int] = None) -> List[Action]:
+        """Get actions of the given type, oldest first, optionally only the most recent `limit` of them."""
+        self._ensure_loaded()
+        key = action_type.value if isinstance(action_type, ActionType) else action_type
+        with self._lock:
+            bucket = self._by_type.get(key, ())
+            if limit is None:
+                return list(bucket)
+            if limit <= 0:
+                return []
+            recent = list(islice(reversed(bucket), limit))
+        recent.reverse()
+        return recent
+
+    def get_actions_by_url(self, url: str) -> List[Action]:
+        """Get all actions recorded against the given URL, oldest first."""
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._by_url.get(url, ()))
+
+    def search_actions(self, query: str) -> List[Action]:
+        """
+        Search the action history for actions containing the query string.
+        
+        Args:
+            query: Case-insensitive text to look for in any field of the action, including its selector
+            
+        Returns:
+            Matching actions, oldest first
+        """
+        self._ensure_loaded()
+        query_lower = query.lower()
+        if "\0" in query_lower:
+            return []
+        with self._lock:
+            if self._search_index is None:
+                offsets: List[int] = []
+                position = 0
+                for blob in self._search_blobs:
+                    offsets.append(position)
+                    position += len(blob) + 1
+                self._search_index = ("\0".join(self._search_blobs), offsets, list(self.history))
+            text, offsets, actions = self._search_index
+        if not offsets:
+            return []
+        
+        # One str.find per match over the joined text; a match cannot span blobs since the query has no NUL
+        results: List[Action] = []
+        start = text.find(query_lower)
+        while start != -1:
+            index = bisect_right(offsets, start) - 1
+            results.append(actions[index])
+            if index + 1 >= len(offsets):
+                break
+            start = text.find(query_lower, offsets[index + 1])
+        return results
+
+    def get_action_statistics(self) -> Dict[str, Any]:
+        """
+        Get summary statistics of the action history.
+        
+        The counts are read from the lookup indexes, which are kept up to date by
+        add_action and trimming, so no pass over the history is needed.
+        
+        Returns:
+            Dictionary with the total action count, per-type counts, the number of
+            distinct URLs visited and the current session ID.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            return {
+                "total_actions": len(self.history),
+                "action_types": {action_type: len(bucket) for action_type, bucket in self._by_type.items()},
+                "unique_urls": len(self._by_url),
+                "session_id": self.session_id
+            }
     
 
 
 
 # Global Playwright action history instance
 _playwright_action_history: Optional[PlaywrightActionHistory] = None
+_playwright_action_history_lock = threading.Lock()
 
 
 def get_playwright_action_history() -> PlaywrightActionHistory:
     """Get the global Playwright action history instance."""
     global _playwright_action_history
     if _playwright_action_history is None:
-        _playwright_action_history = PlaywrightActionHistory()
+        with _playwright_action_history_lock:
+            if _playwright_action_history is None:
+                _playwright_action_history = PlaywrightActionHistory()
+                # Write out any buffered actions when the interpreter exits
+                atexit.register(_playwright_action_history.close)
     return _playwright_action_history
 
 
@@ -145,4 +516,19 @@ def add_playwright_action(action: Action) -> Action:
         The added Action object
     """
     history = get_playwright_action_history()
-    return history.add_action(action)
\ No newline at end of file
+    return history.add_action(action)
+
+
+async def add_playwright_action_async(action: Action) -> Action:
+    """
+    Convenience function to add a Playwright action to history from async code
+    without blocking the event loop on file writes.
+    
+    Args:
+        action: The Action object to add to history
+        
+    Returns:
+        The added Action object
+    """
+    history = get_playwright_action_history()
+    return await history.add_action_async(action)
@@ -6,34 +6,164 @@ for Playwright actions. It queries elements from the current page and generates
 selectors when elements are found.
 """
 
+import os
 import re
-from typing import Dict, Any, Optional, Union, List
-from dataclasses import dataclass
-from enum import Enum
-from playwright.async_api import Page
+import weakref
+from typing import Optional, Union
+from playwright.async_api import BrowserContext, Page, Route
 
 
-class SelectorType(Enum):
-    """Enumeration of supported selector types."""
-    XPATH = "xpathSelector"
-    ATTRIBUTE_VALUE = "attributeValueSelector"
-    TAG_CONTAINS = "tagContainsSelector"
+# A plain mmid attribute selector such as [mmid='114'], [mmid="114"] or [mmid=114]
+_MMID_SELECTOR_RE = re.compile(r"""^\[mmid=(['"]?)([-\w]+)\1\]$""", re.ASCII)
 
 
-@dataclass
-class ParsedSelector:
-    """Represents a parsed selector with its type and data."""
-    type: SelectorType
-    data: Dict[str, Any]
-    original_string: str
+# Builds the XPath for an element in the page, trying in order:
+#   1. id, 2. meaningful classes, 3. other identifying attributes, 4. short text content,
+#   5. tag + two attributes, 6-8. tag + class/name/type, 9. hierarchical position path.
+# Steps 1-4 return the //* form when the page holds exactly one match and the //tag form otherwise.
+_GENERATE_XPATH_FUNCTION = """
+    (element) => {
+        const tagName = element.tagName.toLowerCase();
+        const id = element.id || '';
+        const className = element.className || '';
+        const name = element.name || '';
+        // Match counts are cached per document until the DOM next changes
+        if (!window.__aeMatchCounts) {
+            const matchCounts = new Map();
+            new MutationObserver(() => matchCounts.clear()).observe(
+                document, {childList: true, subtree: true, attributes: true, characterData: true});
+            window.__aeMatchCounts = matchCounts;
+        }
+        const cachedCount = (key, count) => {
+            let matches = window.__aeMatchCounts.get(key);
+            if (matches === undefined) {
+                matches = count();
+                window.__aeMatchCounts.set(key, matches);
+            }
+            return matches;
+        };
+        // Quote a value as an XPath string literal, using concat() when it holds both quote kinds
+        const literal = (value) => {
+            if (!value.includes("'")) {
+                return `'${value}'`;
+            }
+            if (!value.includes('"')) {
+                return `"${value}"`;
+            }
+            return "concat('" + value.split("'").join(`', "'", '`) + "')";
+        };
+        const isUnique = (selector) => cachedCount(selector, () => document.querySelectorAll(selector).length) === 1;
+        
+        // Priority 1: Use ID, unique or combined with the tag
+        if (id) {
+            return isUnique('#' + CSS.escape(id)) ? `//*[@id=${literal(id)}]` : `//${tagName}[@id=${literal(id)}]`;
+        }
+        
+        // Priority 2: Use class if it has classes other than common utility classes
+        if (className) {
+            const meaningfulClasses = className.split(/\\s+/).filter(
+                (cls) => cls && !/^(col-|row-|d-|p-|m-|text-|bg-|border-)/.test(cls));
+            if (meaningfulClasses.length > 0) {
+                return isUnique('.' + meaningfulClasses.map(CSS.escape).join('.'))
+                    ? `//*[@class=${literal(className)}]` : `//${tagName}[@class=${literal(className)}]`;
+            }
+        }
+        
+        // Priority 3: Use the first other identifying attribute that is set; later ones are never read
+        const attributeReaders = [
+            ['name', () => name],
+            ['data-testid', () => element.getAttribute('data-testid') || ''],
+            ['data-id', () => element.getAttribute('data-id') || ''],
+            ['href', () => element.href || ''],
+            ['src', () => element.src || ''],
+            ['title', () => element.title || ''],
+            ['placeholder', () => element.placeholder || '']
+        ];
+        for (const [attr, read] of attributeReaders) {
+            const value = read();
+            if (value) {
+                return isUnique(`[${attr}="${CSS.escape(value)}"]`)
+                    ? `//*[@${attr}=${literal(value)}]` : `//${tagName}[@${attr}=${literal(value)}]`;
+            }
+        }
+        
+        // Priority 4: Use short text content
+        const text = element.textContent ? element.textContent.trim() : '';
+        if (text.length > 0 && text.length < 50) {
+            const textXPath = `count(//*[text()=${literal(text)}])`;
+            const textCount = cachedCount(textXPath, () => document.evaluate(textXPath, document, null,
+                                                                             XPathResult.NUMBER_TYPE, null).numberValue);
+            return textCount === 1 ? `//*[text()=${literal(text)}]` : `//${tagName}[text()=${literal(text)}]`;
+        }
+        
+        // Priority 5: Use combination of tag + multiple attributes
+        const type = element.type || '';
+        if (className && name) {
+            return `//${tagName}[@class=${literal(className)} and @name=${literal(name)}]`;
+        } else if (className && type) {
+            return `//${tagName}[@class=${literal(className)} and @type=${literal(type)}]`;
+        } else if (name && type) {
+            return `//${tagName}[@name=${literal(name)} and @type=${literal(type)}]`;
+        }
+        
+        // Priority 6-8: Use tag with class, name or type (even if not unique)
+        if (className) {
+            return `//${tagName}[@class=${literal(className)}]`;
+        }
+        if (name) {
+            return `//${tagName}[@name=${literal(name)}]`;
+        }
+        if (type) {
+            return `//${tagName}[@type=${literal(type)}]`;
+        }
+        
+        // Priority 9: Fallback to hierarchical XPath with position, walking up to <body>
+        const steps = [];
+        for (let node = element; node !== document.body; node = node.parentElement) {
+            if (!node) {
+                // The element is not inside <body>
+                return '//*';
+            }
+            let position = 1;
+            for (let sibling = node.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+                if (sibling.tagName === node.tagName) {
+                    position++;
+                }
+            }
+            steps.push(node.tagName.toLowerCase() + '[' + position + ']');
+        }
+        steps.push('body');
+        return '//' + steps.reverse().join('/');
+    }
+"""
+
+# The generator is defined once per document as window.__aeGenerateXPath, so that each
+# selector only ships a one-line call instead of the whole function source.
+_INSTALL_GENERATE_XPATH_JS = "window.__aeGenerateXPath = " + _GENERATE_XPATH_FUNCTION.strip() + ";"
+_CALL_GENERATE_XPATH_JS = "(element) => window.__aeGenerateXPath ? window.__aeGenerateXPath(element) : null"
+_INSTALL_AND_CALL_GENERATE_XPATH_JS = (
+    "(element) => { " + _INSTALL_GENERATE_XPATH_JS + " return window.__aeGenerateXPath(element); }"
+)
 
 
 class SelectorGenerator:
     """Generator for creating XPath selectors from mmid-based selectors."""
     
-    def __init__(self):
-        """Initialize the selector generator."""
-        pass
+    def __init__(self, mmid_passthrough: Optional[bool] = None):
+        """
+        Initialize the selector generator.
+        
+        Args:
+            mmid_passthrough: Answer plain [mmid='...'] selectors with //*[@mmid='...'] after a single
+                existence check, skipping the priority ladder. Such XPaths only hold until the mmids are
+                next re-injected, so they cannot be replayed later. Defaults to the AE_MMID_XPATH_PASSTHROUGH
+                environment variable, and otherwise off.
+        """
+        if mmid_passthrough is None:
+            mmid_passthrough = os.getenv("AE_MMID_XPATH_PASSTHROUGH", "false").lower() in ("1", "true")
+        self.mmid_passthrough = mmid_passthrough
+        # Browser contexts that already define the generator in every new document
+        self._contexts_with_init_script: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
     
     async def parse(self, page: Page, selector_with_mmid: str) -> Optional[str]:
         """
@@ -52,17 +182,22 @@ class SelectorGenerator:
         selector_with_mmid = selector_with_mmid.strip()
         
         try:
-            # Query elements from current page using the mmid selector
-            elements = await page.query_selector_all(selector_with_mmid)
+            mmid_match = self.mmid_passthrough and _MMID_SELECTOR_RE.match(selector_with_mmid)
+            if mmid_match:
+                # The mmid already names a single element, so only check that it is on the page
+                if not await page.evaluate("(selector) => document.querySelector(selector) !== null", selector_with_mmid):
+                    return None
+                return f"//*[@mmid='{mmid_match.group(2)}']"
             
-            # If element count is greater than 0, generate XPath selector
-            if len(elements) > 0:
-                # Generate XPath for the first element
-                xpath_selector = await self._generate_xpath_for_element(page, elements[0])
-                return xpath_selector
-            else:
-                # If count is 0, return None
+            # Query the first element matching the mmid selector; only that one is used
+            element = await page.query_selector(selector_with_mmid)
+            if element is None:
                 return None
+            
+            try:
+                return await self._generate_xpath_for_element(page, element)
+            finally:
+                await element.dispose()
                 
         except Exception:
             # If there's any error, return None
@@ -72,6 +207,9 @@ class SelectorGenerator:
         """
         Generate XPath selector for a given element with priority on id and class attributes.
         
+        The attribute reads, uniqueness checks and priority ladder all run in the page
+        in a single evaluate call, so a selector costs one browser round-trip.
+        
         Args:
             page: The Playwright Page object
             element: The element to generate XPath for
@@ -80,101 +218,12 @@ class SelectorGenerator:
             XPath selector string
         """
         try:
-            # Get element attributes for better XPath generation
-            element_info = await page.evaluate("""
-                (element) => {
-                    return {
-                        tagName: element.tagName.toLowerCase(),
-                        id: element.id || '',
-                        className: element.className || '',
-                        name: element.name || '',
-                        type: element.type || '',
-                        value: element.value || '',
-                        text: element.textContent ? element.textContent.trim() : '',
-                        href: element.href || '',
-                        src: element.src || '',
-                        title: element.title || '',
-                        href: element.href || '',
-                        placeholder: element.placeholder || '',
-                        'data-testid': element.getAttribute('data-testid') || '',
-                        'data-id': element.getAttribute('data-id') || '',
-                        'data-value': element.getAttribute('data-value') || ''
-                    };
-                }
-            """, element)
-            
-            tag_name = element_info['tagName']
-            
-            # Priority 1: Use ID if available and unique
-            if element_info['id']:
-                # Check if ID is unique on the page
-                id_count = await page.evaluate(f"document.querySelectorAll('#{element_info['id']}').length")
-                if id_count == 1:
-                    return f"//*[@id='{element_info['id']}']"
-                else:
-                    # If ID is not unique, use tag + ID combination
-                    return f"//{tag_name}[@id='{element_info['id']}']"
-            
-            # Priority 2: Use class if available and meaningful
-            if element_info['className']:
-                classes = element_info['className'].split()
-                # Filter out common utility classes that might not be unique
-                meaningful_classes = [cls for cls in classes if not cls.startswith(('col-', 'row-', 'd-', 'p-', 'm-', 'text-', 'bg-', 'border-'))]
-                
-                if meaningful_classes:
-                    # Use the first meaningful class
-                    primary_class = meaningful_classes[0]
-                    # Check if this class combination is unique
-                    class_selector = f".{'.'.join(meaningful_classes)}"
-                    class_count = await page.evaluate(f"document.querySelectorAll('{class_selector}').length")
-                    
-                    if class_count == 1:
-                        return f"//*[@class='{element_info['className']}']"
-                    else:
-                        return f"//{tag_name}[@class='{element_info['className']}']"
-            
-            # Priority 3: Use other unique attributes
-            unique_attrs = ['name', 'data-testid', 'data-id', 'href', 'src', 'title', 'placeholder']
-            for attr in unique_attrs:
-                if element_info[attr]:
-                    # Check if this attribute value is unique
-                    attr_count = await page.evaluate(f"document.querySelectorAll('[{attr}=\"{element_info[attr]}\"]').length")
-                    if attr_count == 1:
-                        return f"//*[@{attr}='{element_info[attr]}']"
-                    else:
-                        return f"//{tag_name}[@{attr}='{element_info[attr]}']"
-            
-            # Priority 4: Use text content if it's unique and meaningful
-            if element_info['text'] and len(element_info['text']) > 0 and len(element_info['text']) < 50:
-                # Check if this text is unique
-                text_count = await page.evaluate(f"document.evaluate('count(//*[text()=\"{element_info['text']}\"])', document, null, XPathResult.NUMBER_TYPE, null).numberValue")
-                if text_count == 1:
-                    return f"//*[text()='{element_info['text']}']"
-                else:
-                    return f"//{tag_name}[text()='{element_info['text']}']"
-            
-            # Priority 5: Use combination of tag + multiple attributes
-            if element_info['className'] and element_info['name']:
-                return f"//{tag_name}[@class='{element_info['className']}' and @name='{element_info['name']}']"
-            elif element_info['className'] and element_info['type']:
-                return f"//{tag_name}[@class='{element_info['className']}' and @type='{element_info['type']}']"
-            elif element_info['name'] and element_info['type']:
-                return f"//{tag_name}[@name='{element_info['name']}' and @type='{element_info['type']}']"
-            
-            # Priority 6: Use tag with class (even if not unique)
-            if element_info['className']:
-                return f"//{tag_name}[@class='{element_info['className']}']"
-            
-            # Priority 7: Use tag with name
-            if element_info['name']:
-                return f"//{tag_name}[@name='{element_info['name']}']"
-            
-            # Priority 8: Use tag with type
-            if element_info['type']:
-                return f"//{tag_name}[@type='{element_info['type']}']"
-            
-            # Priority 9: Fallback to hierarchical XPath with position
-            return await self._generate_hierarchical_xpath(page, element)
+            await self._register_init_script(page)
+            xpath = await element.evaluate(_CALL_GENERATE_XPATH_JS)
+            if xpath is None:
+                # This document predates the init script: define the generator and run it in the same call
+                xpath = await element.evaluate(_INSTALL_AND_CALL_GENERATE_XPATH_JS)
+            return xpath
             
         except Exception:
             # Final fallback: try to generate a simple XPath based on tag
@@ -184,49 +233,17 @@ class SelectorGenerator:
             except Exception:
                 return '//*'
     
-    async def _generate_hierarchical_xpath(self, page: Page, element) -> str:
-        """
-        Generate hierarchical XPath using element position as fallback.
-        
-        Args:
-            page: The Playwright Page object
-            element: The element to generate XPath for
-            
-        Returns:
-            XPath selector string
-        """
+    async def _register_init_script(self, page: Page):
+        """Define the XPath generator in every document the page's browser context loads from now on."""
+        context = page.context
+        if context in self._contexts_with_init_script:
+            return
+        self._contexts_with_init_script.add(context)
         try:
-            xpath = await page.evaluate("""
-                (element) => {
-                    function getXPath(element) {
-                        if (element === document.body) {
-                            return element.tagName.toLowerCase();
-                        }
-                        
-                        var ix = 0;
-                        var siblings = element.parentNode.childNodes;
-                        for (var i = 0; i < siblings.length; i++) {
-                            var sibling = siblings[i];
-                            if (sibling === element) {
-                                return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                            }
-                            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) {
-                                ix++;
-                            }
-                        }
-                    }
-                    return getXPath(element);
-                }
-            """, element)
-            
-            # Ensure it starts with //
-            if not xpath.startswith('//'):
-                xpath = '//' + xpath
-                
-            return xpath
-            
+            await context.add_init_script(script=_INSTALL_GENERATE_XPATH_JS)
         except Exception:
-            return '//*'
+            # Documents then define the generator on their first selector instead
+            pass
     
 
 
@@ -243,6 +260,32 @@ def get_selector_generator() -> SelectorGenerator:
     return _selector_generator
 
 
+# Request resource types that selector generation never needs: they only add loading and layout work
+BLOCKED_RESOURCE_TYPES = frozenset({
+    "image", "stylesheet", "font", "media", "texttrack", "beacon", "csp_report", "imageset"
+})
+
+
+async def _abort_blocked_resources(route: Route):
+    """Abort requests for blocked resource types and let every other request through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_assets(target: Union[Page, BrowserContext]):
+    """
+    Stop a page, or every page of a browser context, from loading images, stylesheets, fonts and media.
+    
+    Meant for browsers used purely for selector generation, where these assets only slow down loading.
+    
+    Args:
+        target: The Playwright Page or BrowserContext to install the request filter on
+    """
+    await target.route("**/*", _abort_blocked_resources)
+
+
 async def generate_selector(page: Page, selector_with_mmid: str) -> Optional[str]:
     """
     Convenience function to generate XPath selector from mmid-based selector.
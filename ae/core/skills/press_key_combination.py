@@ -6,7 +6,7 @@ from playwright.async_api import Page  # type: ignore
 
 from ae.core.playwright_manager import PlaywrightManager
 from ae.core.skills.playwright_actions.action_classes import SendKeysIWAAction, action_to_json
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.utils.dom_mutation_observer import subscribe  # type: ignore
 from ae.utils.dom_mutation_observer import unsubscribe  # type: ignore
 from ae.utils.logger import logger
@@ -41,7 +41,7 @@ async def press_key_combination(key_combination: Annotated[str, "The key to pres
 
     press_key_combination_action = SendKeysIWAAction.from_dict({"keys": key_combination})
     if press_key_combination_action:
-        add_playwright_action(press_key_combination_action)
+        await add_playwright_action_async(press_key_combination_action)
         logger.info(f"Added press key combination action to history: {action_to_json(press_key_combination_action)}")
     else:
         logger.warning(f"Could not create press key combination action for key combo: {key_combination}")
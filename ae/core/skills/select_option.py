@@ -1,17 +1,18 @@
 import asyncio
-import inspect
-import traceback
 from typing import Annotated
 
 from playwright.async_api import Page
 
 from ae.core.playwright_manager import PlaywrightManager
-from ae.utils.dom_helper import get_element_outer_html
+from ae.utils.dom_helper import build_opening_tag
+from ae.utils.dom_helper import get_element_tag_name_and_attributes
+from ae.utils.dom_helper import wait_for_selector_with_adaptive_timeout
 from ae.utils.dom_mutation_observer import subscribe  # type: ignore
 from ae.utils.dom_mutation_observer import unsubscribe  # type: ignore
+from ae.utils.dom_mutation_observer import wait_for_dom_changes  # type: ignore
 from ae.utils.logger import logger
 from ae.utils.ui_messagetype import MessageType
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
 from ae.core.skills.playwright_actions.action_classes import SelectOptionAction, action_to_json
 
 
@@ -42,25 +43,28 @@ async def select_option(selector: Annotated[str, "The properly formed query sele
         
     select_action = await SelectOptionAction.from_string_with_generator(page, selector, value)
     if select_action:
-        add_playwright_action(select_action)
+        await add_playwright_action_async(select_action)
         logger.info(f"Added select option action to history: {action_to_json(select_action)}")
     else:
         logger.warning(f"Could not create select option action for selector: {selector}")
 
-    function_name = inspect.currentframe().f_code.co_name # type: ignore
+    function_name = "select_option"
 
     await browser_manager.take_screenshots(f"{function_name}_start", page)
 
     await browser_manager.highlight_element(selector, True)
 
     dom_changes_detected=None
+    dom_changes_event = asyncio.Event()
     def detect_dom_changes(changes:str): # type: ignore
         nonlocal dom_changes_detected
         dom_changes_detected = changes # type: ignore
+        dom_changes_event.set()
 
     subscribe(detect_dom_changes)
     result = await do_select_option(page, selector, value, wait_before_execution)
-    await asyncio.sleep(0.1) # sleep for 100ms to allow the mutation observer to detect changes
+    # Wait up to 100ms for the mutation observer to detect changes, returning once its reports go quiet
+    await wait_for_dom_changes(dom_changes_event)
     unsubscribe(detect_dom_changes)
     await browser_manager.take_screenshots(f"{function_name}_end", page)
     await browser_manager.notify_user(result["summary_message"], message_type=MessageType.ACTION)
@@ -93,30 +97,21 @@ async def do_select_option(page: Page, selector: str, value: str, wait_before_ex
     try:
         logger.info(f"Executing SelectOption with \"{selector}\" as the selector. Waiting for the element to be attached and visible.")
 
-        element = await asyncio.wait_for(
-            page.wait_for_selector(selector, state="attached", timeout=2000),
-            timeout=2000
-        )
+        element = await wait_for_selector_with_adaptive_timeout(page, selector, state="attached", max_timeout_millis=2000)
         if element is None:
             raise ValueError(f"Select element with selector: \"{selector}\" not found")
 
         logger.info(f"Select element with selector: \"{selector}\" is attached. Scrolling it into view if needed.")
         try:
+            # Scrolling waits for the element to be visible and stable, so no separate visibility wait is needed
             await element.scroll_into_view_if_needed(timeout=200)
-            logger.info(f"Select element with selector: \"{selector}\" is attached and scrolled into view. Waiting for the element to be visible.")
+            logger.info(f"Select element with selector: \"{selector}\" is visible and scrolled into view. Selecting the option.")
         except Exception:
-            # If scrollIntoView fails, just move on, not a big deal
+            # If the element is not visible or scrollIntoView fails, try to select it anyway
             pass
 
-        try:
-            await element.wait_for_element_state("visible", timeout=200)
-            logger.info(f"Executing SelectOption with \"{selector}\" as the selector. Element is attached and visible. Selecting the option.")
-        except Exception:
-            # If the element is not visible, try to select it anyway
-            pass
-
-        element_tag_name = await element.evaluate("element => element.tagName.toLowerCase()")
-        element_outer_html = await get_element_outer_html(element, page, element_tag_name)
+        element_tag_name, element_attributes = await get_element_tag_name_and_attributes(element)
+        element_outer_html = build_opening_tag(element_tag_name, element_attributes)
 
         if element_tag_name != "select":
             raise ValueError(f"Element with selector: \"{selector}\" is not a select element. Found: {element_tag_name}")
@@ -131,6 +126,5 @@ async def do_select_option(page: Page, selector: str, value: str, wait_before_ex
 
     except Exception as e:
         logger.error(f"Unable to select option with value \"{value}\" from element with selector: \"{selector}\". Error: {e}")
-        traceback.print_exc()
         msg = f"Unable to select option with value \"{value}\" from element with selector: \"{selector}\" since the selector is invalid or the value doesn't exist. Proceed by retrieving DOM again."
         return {"summary_message": msg, "detailed_message": f"{msg}. Error: {e}"}
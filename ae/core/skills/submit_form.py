@@ -1,6 +1,4 @@
 import asyncio
-import inspect
-import traceback
 from typing import Annotated
 
 from playwright.async_api import ElementHandle
@@ -8,10 +6,13 @@ from playwright.async_api import Page
 
 from ae.core.playwright_manager import PlaywrightManager
 from ae.core.skills.playwright_actions.action_classes import SubmitAction, action_to_json
-from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action
-from ae.utils.dom_helper import get_element_outer_html
+from ae.core.skills.playwright_actions.playwright_action_history import add_playwright_action_async
+from ae.utils.dom_helper import build_opening_tag
+from ae.utils.dom_helper import get_element_tag_name_and_attributes
+from ae.utils.dom_helper import wait_for_selector_with_adaptive_timeout
 from ae.utils.dom_mutation_observer import subscribe  # type: ignore
 from ae.utils.dom_mutation_observer import unsubscribe  # type: ignore
+from ae.utils.dom_mutation_observer import wait_for_dom_changes  # type: ignore
 from ae.utils.logger import logger
 from ae.utils.ui_messagetype import MessageType
 
@@ -42,25 +43,28 @@ async def submit_form(
 
     submit_form_action = await SubmitAction.from_string_with_generator(page, selector)
     if submit_form_action:
-        add_playwright_action(submit_form_action)
+        await add_playwright_action_async(submit_form_action)
         logger.info(f"Added submit form action to history: {action_to_json(submit_form_action)}")
     else:
         logger.warning(f"Could not create submit form action for selector: {selector}")
 
-    function_name = inspect.currentframe().f_code.co_name  # type: ignore
+    function_name = "submit_form"
 
     await browser_manager.take_screenshots(f"{function_name}_start", page)
     await browser_manager.highlight_element(selector, True)
 
     dom_changes_detected: str | None = None
+    dom_changes_event = asyncio.Event()
     
     def detect_dom_changes(changes: str):  # type: ignore
         nonlocal dom_changes_detected
         dom_changes_detected = changes  # type: ignore
+        dom_changes_event.set()
 
     subscribe(detect_dom_changes)
     result = await do_submit_form(page, selector, wait_before_execution)
-    await asyncio.sleep(0.1)  # sleep for 100ms to allow the mutation observer to detect changes
+    # Wait up to 100ms for the mutation observer to detect changes, returning once its reports go quiet
+    await wait_for_dom_changes(dom_changes_event)
     unsubscribe(detect_dom_changes)
     await browser_manager.take_screenshots(f"{function_name}_end", page)
     await browser_manager.notify_user(result["summary_message"], message_type=MessageType.ACTION)
@@ -91,30 +95,21 @@ async def do_submit_form(page: Page, selector: str, wait_before_execution: float
     try:
         logger.info(f"Executing submit_form with \"{selector}\" as the selector. Waiting for the element to be attached and visible.")
 
-        element = await asyncio.wait_for(
-            page.wait_for_selector(selector, state="attached", timeout=2000),
-            timeout=2000
-        )
+        element = await wait_for_selector_with_adaptive_timeout(page, selector, state="attached", max_timeout_millis=2000)
         if element is None:
             raise ValueError(f"Element with selector: \"{selector}\" not found")
 
         logger.info(f"Element with selector: \"{selector}\" is attached. Scrolling it into view if needed.")
         try:
+            # Scrolling waits for the element to be visible and stable, so no separate visibility wait is needed
             await element.scroll_into_view_if_needed(timeout=200)
-            logger.info(f"Element with selector: \"{selector}\" is attached and scrolled into view. Waiting for the element to be visible.")
+            logger.info(f"Element with selector: \"{selector}\" is visible and scrolled into view. Submitting the form.")
         except Exception:
-            # If scrollIntoView fails, just move on, not a big deal
+            # If the element is not visible or scrollIntoView fails, try to submit it anyway
             pass
 
-        try:
-            await element.wait_for_element_state("visible", timeout=200)
-            logger.info(f"Executing submit_form with \"{selector}\" as the selector. Element is attached and visible. Submitting the form.")
-        except Exception:
-            # If the element is not visible, try to submit it anyway
-            pass
-
-        element_tag_name = await element.evaluate("element => element.tagName.toLowerCase()")
-        element_outer_html = await get_element_outer_html(element, page, element_tag_name)
+        element_tag_name, element_attributes = await get_element_tag_name_and_attributes(element)
+        element_outer_html = build_opening_tag(element_tag_name, element_attributes)
 
         # Handle different types of form submission
         if element_tag_name == "form":
@@ -126,10 +121,10 @@ async def do_submit_form(page: Page, selector: str, wait_before_execution: float
             }
         elif element_tag_name in ["button", "input"]:
             # Check if it's a submit button
-            element_type = await element.get_attribute("type")
+            element_type = element_attributes.get("type")
             if element_type == "submit" or element_tag_name == "button":
                 # Click the submit button
-                msg = await perform_submit_button_click(page, selector)
+                msg = await perform_submit_button_click(page, selector, element)
                 return {
                     "summary_message": msg,
                     "detailed_message": f"{msg} The clicked submit element's outer HTML is: {element_outer_html}."
@@ -151,7 +146,6 @@ async def do_submit_form(page: Page, selector: str, wait_before_execution: float
 
     except Exception as e:
         logger.error(f"Unable to submit form with selector: \"{selector}\". Error: {e}")
-        traceback.print_exc()
         msg = f"Unable to submit form with selector: \"{selector}\" since the selector is invalid or the form submission failed. Proceed by retrieving DOM again."
         return {"summary_message": msg, "detailed_message": f"{msg}. Error: {e}"}
 
@@ -168,15 +162,7 @@ async def submit_form_element(page: Page, selector: str, form_element: ElementHa
     Returns:
     - Success message string.
     """
-    js_code = """(selector) => {
-        let form = document.querySelector(selector);
-        if (!form) {
-            return `submit_form: Form element with selector ${selector} not found`;
-        }
-        if (form.tagName.toLowerCase() !== 'form') {
-            return `submit_form: Element with selector ${selector} is not a form`;
-        }
-        
+    js_code = """(form, selector) => {
         try {
             form.submit();
             return `Successfully submitted form with selector: ${selector}`;
@@ -187,7 +173,7 @@ async def submit_form_element(page: Page, selector: str, form_element: ElementHa
     
     try:
         logger.info(f"Submitting form element with selector: {selector}")
-        result: str = await page.evaluate(js_code, selector)
+        result: str = await form_element.evaluate(js_code, selector)
         logger.debug(f"Form submission result: {result}")
         return result
     except Exception as e:
@@ -195,23 +181,19 @@ async def submit_form_element(page: Page, selector: str, form_element: ElementHa
         return f"Error submitting form with selector: {selector}. Error: {e}"
 
 
-async def perform_submit_button_click(page: Page, selector: str) -> str:
+async def perform_submit_button_click(page: Page, selector: str, button_element: ElementHandle) -> str:
     """
     Clicks a submit button using JavaScript.
     
     Parameters:
     - page: The Playwright page instance.
     - selector: The selector string of the submit button. Use Playwright's native selectors: xpath, attribute selectors, or text-based selectors (tagContainsSelector).
+    - button_element: The submit button ElementHandle.
     
     Returns:
     - Success message string.
     """
-    js_code = """(selector) => {
-        let button = document.querySelector(selector);
-        if (!button) {
-            return `submit_form: Submit button with selector ${selector} not found`;
-        }
-        
+    js_code = """(button, selector) => {
         try {
             button.click();
             return `Successfully clicked submit button with selector: ${selector}`;
@@ -222,7 +204,7 @@ async def perform_submit_button_click(page: Page, selector: str) -> str:
     
     try:
         logger.info(f"Clicking submit button with selector: {selector}")
-        result: str = await page.evaluate(js_code, selector)
+        result: str = await button_element.evaluate(js_code, selector)
         logger.debug(f"Submit button click result: {result}")
         return result
     except Exception as e:
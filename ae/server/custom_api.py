@@ -3,13 +3,11 @@ import json
 import logging
 import os
 import uuid
-from queue import Empty
-from queue import Queue
+from collections import OrderedDict
 from typing import Any
 
 import uvicorn
 
-from playwright.sync_api import sync_playwright
 from fastapi import FastAPI
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,11 +16,8 @@ from pydantic import BaseModel
 from pydantic import Field
 
 import ae.core.playwright_manager as browserManager
-from ae.config import SOURCE_LOG_FOLDER_PATH
 from ae.core.agents_llm_config import AgentsLLMConfig
 from ae.core.autogen_wrapper import AutogenWrapper
-from ae.utils.formatting_helper import is_terminating_message
-from ae.utils.ui_messagetype import MessageType
 from ae.core.skills.playwright_actions.playwright_action_history import get_playwright_action_history
 
 browser_manager = browserManager.PlaywrightManager(headless=False)
@@ -33,10 +28,16 @@ API_PREFIX = "/api"
 IS_DEBUG = False
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8080))
-WORKERS = 1
+# Each worker process launches its own browser and appends to the same action history file, so keep 1 unless both are accounted for
+WORKERS = int(os.getenv("WORKERS", 1))
 
 container_id = os.getenv("CONTAINER_ID", "")
 
+# Idle AutogenWrapper instances, keyed by agent configs and chat round limits, reused across requests
+# the way SystemOrchestrator reuses one wrapper across commands. Bounded to the most recent configs.
+MAX_AUTOGEN_WRAPPER_CONFIGS = 8
+idle_autogen_wrappers: OrderedDict[tuple[str, str, int, int], list[AutogenWrapper]] = OrderedDict()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("uvicorn")
@@ -78,7 +79,7 @@ async def startup_event():
 
 @app.post("/execute_task", description="Execute a given command related to web navigation and return the result.")
 async def execute_task(request: Request, query_model: CommandQueryModel):
-    notification_queue = Queue()  # type: ignore
+    notification_queue: asyncio.Queue[dict[str, str]] = asyncio.Queue()
     transaction_id = str(uuid.uuid4()) if query_model.clientid is None else query_model.clientid
 
     return JSONResponse(await run_task(request, transaction_id, query_model.command, query_model.page_url, notification_queue, query_model.request_originator,query_model.llm_config,
@@ -86,7 +87,7 @@ async def execute_task(request: Request, query_model: CommandQueryModel):
                                       browser_nav_max_chat_round=query_model.browser_nav_max_chat_round))
 
 
-async def run_task(request: Request, transaction_id: str, command: str, page_url: str, notification_queue: Queue, request_originator: str|None = None, llm_config: dict[str,Any]|None = None,   # type: ignore
+async def run_task(request: Request, transaction_id: str, command: str, page_url: str, notification_queue: asyncio.Queue[dict[str, str]], request_originator: str|None = None, llm_config: dict[str,Any]|None = None,   # type: ignore
              planner_max_chat_round: int = 50, browser_nav_max_chat_round: int = 10):
     return await process_command(command, page_url, planner_max_chat_round, browser_nav_max_chat_round, llm_config)
 
@@ -108,9 +109,16 @@ async def process_command(command: str, page_url: str, planner_max_chat_round: i
     planner_agent_config = normalized_llm_config.get_planner_agent_config()
     browser_nav_agent_config = normalized_llm_config.get_browser_nav_agent_config()
 
-    ag = await AutogenWrapper.create(planner_agent_config, browser_nav_agent_config, planner_max_chat_round=planner_max_chat_round,
-                                     browser_nav_max_chat_round=browser_nav_max_chat_round)
+    wrapper_key = (json.dumps(planner_agent_config, sort_keys=True, default=str), json.dumps(browser_nav_agent_config, sort_keys=True, default=str),
+                   planner_max_chat_round, browser_nav_max_chat_round)
+    idle_wrappers = idle_autogen_wrappers.get(wrapper_key)
+    if idle_wrappers:
+        ag = idle_wrappers.pop()
+    else:
+        ag = await AutogenWrapper.create(planner_agent_config, browser_nav_agent_config, planner_max_chat_round=planner_max_chat_round,
+                                         browser_nav_max_chat_round=browser_nav_max_chat_round)
     result = await ag.process_command(command, page_url)  # type: ignore
+    release_autogen_wrapper(wrapper_key, ag)
 
     print(f"Result of command execution: {result}")
     action_history = get_playwright_action_history().get_recent_actions(15)
@@ -120,6 +128,18 @@ async def process_command(command: str, page_url: str, planner_max_chat_round: i
     action_history_json = [action.to_dict() for action in action_history]
     return { "actions": action_history_json}
 
+
+def release_autogen_wrapper(wrapper_key: tuple[str, str, int, int], ag: AutogenWrapper):
+    """
+    Return an AutogenWrapper to the idle pool once its command has completed.
+    Each chat clears the previous history when it starts, so the wrapper can serve the next request with the same configuration.
+    """
+    idle_autogen_wrappers.setdefault(wrapper_key, []).append(ag)
+    idle_autogen_wrappers.move_to_end(wrapper_key)
+    while len(idle_autogen_wrappers) > MAX_AUTOGEN_WRAPPER_CONFIGS:
+        idle_autogen_wrappers.popitem(last=False)
+
+
 if __name__ == "__main__":
     logger.info("**********Application Started**********")
     uvicorn.run("main:app", host=HOST, port=PORT, workers=WORKERS, reload=IS_DEBUG, log_level="info")
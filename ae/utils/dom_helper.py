@@ -1,4 +1,9 @@
 import asyncio
+import statistics
+import time
+from collections import defaultdict
+from collections import deque
+from urllib.parse import urlparse
 
 from playwright.async_api import ElementHandle
 from playwright.async_api import Page
@@ -18,6 +23,77 @@ async def wait_for_non_loading_dom_state(page: Page, max_wait_millis: int):
         await asyncio.sleep(0.05)
 
 
+# Recent wait_for_selector latencies in milliseconds, per host, used to size later timeouts
+_ELEMENT_WAIT_MILLIS: defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=20))
+_MIN_ELEMENT_WAIT_SAMPLES = 5
+_MIN_ELEMENT_WAIT_TIMEOUT_MILLIS = 500
+
+
+async def wait_for_selector_with_adaptive_timeout(page: Page, selector: str, state: str = "attached", max_timeout_millis: int = 2000) -> ElementHandle | None:
+    """
+    Waits for a selector, timing out sooner on hosts where elements have recently been found quickly.
+
+    The timeout is four times the median of the recent successful waits on the page's host, kept between 500 ms and max_timeout_millis.
+    Hosts with fewer than 5 recorded waits get the full max_timeout_millis.
+
+    Args:
+        page (Page): The page to wait on.
+        selector (str): The selector to wait for.
+        state (str, optional): The element state to wait for, as for Page.wait_for_selector. Defaults to "attached".
+        max_timeout_millis (int, optional): The longest timeout to use. Defaults to 2000.
+
+    Returns:
+        ElementHandle | None: The element, as returned by Page.wait_for_selector.
+    """
+    wait_millis = _ELEMENT_WAIT_MILLIS[urlparse(page.url).netloc]
+    timeout = max_timeout_millis
+    if len(wait_millis) >= _MIN_ELEMENT_WAIT_SAMPLES:
+        timeout = min(max_timeout_millis, max(_MIN_ELEMENT_WAIT_TIMEOUT_MILLIS, 4 * statistics.median(wait_millis)))
+
+    start = time.monotonic()
+    element = await page.wait_for_selector(selector, state=state, timeout=timeout)  # type: ignore
+    wait_millis.append((time.monotonic() - start) * 1000)
+    return element
+
+
+# Attributes included in the opening tag that skills report back for an element
+ATTRIBUTES_OF_INTEREST: list[str] = ['id', 'name', 'aria-label', 'placeholder', 'href', 'src', 'aria-autocomplete', 'role', 'type',
+                                     'data-testid', 'value', 'selected', 'aria-labelledby', 'aria-describedby', 'aria-haspopup']
+
+_READ_TAG_NAME_AND_ATTRIBUTES_JS = "(element, attributes) => [element.tagName.toLowerCase(), attributes.map((attr) => element.getAttribute(attr))]"
+
+
+async def get_element_tag_name_and_attributes(element: ElementHandle) -> tuple[str, dict[str, str]]:
+    """
+    Reads the tag name and the attributes of interest of an HTML element in a single round-trip to the browser.
+
+    Args:
+        element (ElementHandle): The element to read.
+
+    Returns:
+        tuple[str, dict[str, str]]: The lowercase tag name, and the attributes of interest that have a non-empty value, in ATTRIBUTES_OF_INTEREST order.
+    """
+    tag_name, values = await element.evaluate(_READ_TAG_NAME_AND_ATTRIBUTES_JS, ATTRIBUTES_OF_INTEREST)
+    return tag_name, {attr: value for attr, value in zip(ATTRIBUTES_OF_INTEREST, values) if value}
+
+
+def build_opening_tag(tag_name: str, attributes: dict[str, str]) -> str:
+    """
+    Constructs the opening tag of an HTML element from its tag name and attributes.
+
+    Args:
+        tag_name (str): The tag name of the element.
+        attributes (dict[str, str]): The attributes to include, as returned by get_element_tag_name_and_attributes.
+
+    Returns:
+        str: The opening tag of the HTML element.
+    """
+    opening_tag: str = f'<{tag_name}'
+    for attr, value in attributes.items():
+        opening_tag += f' {attr}="{value}"'
+    return opening_tag + '>'
+
+
 async def get_element_outer_html(element: ElementHandle, page: Page, element_tag_name: str|None = None) -> str:
     """
     Constructs the opening tag of an HTML element along with its attributes.
@@ -30,16 +106,5 @@ async def get_element_outer_html(element: ElementHandle, page: Page, element_tag
     Returns:
         str: The opening tag of the HTML element, including a select set of attributes.
     """
-    tag_name: str = element_tag_name if element_tag_name else await page.evaluate("element => element.tagName.toLowerCase()", element)
-
-    attributes_of_interest: list[str] = ['id', 'name', 'aria-label', 'placeholder', 'href', 'src', 'aria-autocomplete', 'role', 'type',
-                                         'data-testid', 'value', 'selected', 'aria-labelledby', 'aria-describedby', 'aria-haspopup']
-    opening_tag: str = f'<{tag_name}'
-
-    for attr in attributes_of_interest:
-        value: str = await element.get_attribute(attr) # type: ignore
-        if value:
-            opening_tag += f' {attr}="{value}"'
-    opening_tag += '>'
-
-    return opening_tag
+    tag_name, attributes = await get_element_tag_name_and_attributes(element)
+    return build_opening_tag(element_tag_name if element_tag_name else tag_name, attributes)
@@ -16,6 +16,25 @@ def subscribe(callback: Callable[[str], None]) -> None:
 def unsubscribe(callback: Callable[[str], None]) -> None:
     DOM_change_callback.remove(callback)
 
+async def wait_for_dom_changes(changes_event: asyncio.Event, timeout: float = 0.1, quiet_period: float = 0.05) -> None:
+    """
+    Waits up to timeout seconds for the mutation observer to report changes, by way of an event set by a subscribed callback.
+    Returns early only once reports have stopped for quiet_period seconds, so a later batch within the window
+    (e.g. fields rendered after an XHR) still reaches the subscriber.
+    """
+    clock = asyncio.get_running_loop()
+    deadline = clock.time() + timeout
+    try:
+        await asyncio.wait_for(changes_event.wait(), timeout=timeout)
+        while True:
+            changes_event.clear()
+            remaining = deadline - clock.time()
+            if remaining <= 0:
+                return
+            await asyncio.wait_for(changes_event.wait(), timeout=min(quiet_period, remaining))
+    except asyncio.TimeoutError:
+        pass
+
 
 async def add_mutation_observer(page:Page):
     """
@@ -29,7 +48,11 @@ async def add_mutation_observer(page:Page):
 
     await page.evaluate("""
         console.log('Adding a mutation observer for DOM changes');
-        new MutationObserver((mutationsList, observer) => {
+        // Mutations are queued and reported once per frame, so bursts of DOM updates cross over to Python as one payload
+        let pendingMutations = [];
+        const reportMutations = () => {
+            const mutationsList = pendingMutations;
+            pendingMutations = [];
             let changes_detected = [];
             for(let mutation of mutationsList) {
                 if (mutation.type === 'childList') {
@@ -61,6 +84,14 @@ async def add_mutation_observer(page:Page):
             if(changes_detected.length > 0) {
                 window.dom_mutation_change_detected(JSON.stringify(changes_detected));
             }
+        };
+        new MutationObserver((mutationsList, observer) => {
+            if(pendingMutations.length === 0) {
+                setTimeout(reportMutations, 16);
+            }
+            for(const mutation of mutationsList) {
+                pendingMutations.push(mutation);
+            }
         }).observe(document, {subtree: true, childList: true, characterData: true});
         """)
 
@@ -11,7 +11,7 @@ from ae.config import SOURCE_LOG_FOLDER_PATH
 from ae.core.playwright_manager import PlaywrightManager
 from ae.utils.logger import logger
 
-space_delimited_mmid = re.compile(r'^[\d ]+$')
+space_delimited_mmid = re.compile(r'^[\d ]+$', re.ASCII)
 
 def is_space_delimited_mmid(s: str) -> bool:
     """